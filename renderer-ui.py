@@ -1,11 +1,41 @@
 import bpy
+import atexit
 import os
+import subprocess
+import sys
 import tempfile
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bpy.props import StringProperty, BoolProperty, CollectionProperty, IntProperty, EnumProperty
 from bpy.types import Panel, Operator, PropertyGroup
+from bpy.app.handlers import persistent
+
+try:
+    import websocket  # websocket-client, optional
+except ImportError:
+    websocket = None
+
+try:
+    import orjson  # optional, much faster than the json module
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import plyer  # optional, for desktop notifications
+    _NOTIFY = plyer.notification.notify
+except ImportError:
+    _NOTIFY = None
 
 bl_info = {
     "name": "Remote Render - Server Integration",
@@ -17,15 +47,28 @@ bl_info = {
     "category": "Render",
 }
 
+JOB_STATUS_ITEMS = [
+    ('SUBMITTED', "Submitted", "Job was sent to the server"),
+    ('QUEUED', "Queued", "Job is waiting for a render node"),
+    ('RENDERING', "Rendering", "Job is being rendered"),
+    ('COMPLETED', "Completed", "Job finished successfully"),
+    ('FAILED', "Failed", "Job failed on the server"),
+    ('UNKNOWN', "Unknown", "Server reported a status this add-on doesn't know"),
+]
+JOB_STATUSES = {item[0] for item in JOB_STATUS_ITEMS}
+
 class RemoteRenderJob(PropertyGroup):
     job_id: StringProperty(name="Job ID")
     scene_name: StringProperty(name="Scene Name")
     submitted_time: StringProperty(name="Submitted")
-    status: StringProperty(name="Status", default="SUBMITTED")
+    status: EnumProperty(name="Status", items=JOB_STATUS_ITEMS, default='SUBMITTED')
     progress: IntProperty(name="Progress", default=0, min=0, max=100, subtype='PERCENTAGE')
     is_complete: BoolProperty(name="Complete", default=False)
     has_notification: BoolProperty(name="New", default=True)  # For showing notification badge
     error_message: StringProperty(name="Error", default="")
+    download_progress: IntProperty(name="Download", default=0, min=0, max=100, subtype='PERCENTAGE')
+    download_message: StringProperty(name="Download Status", default="")
+    download_failed: BoolProperty(name="Download Failed", default=False)
 
 class ServerIntegratedSettings(PropertyGroup):
     server_url: StringProperty(
@@ -68,8 +111,636 @@ class ServerIntegratedSettings(PropertyGroup):
     )
 
     server_status: StringProperty(name="Server Status", default="Unknown")
+    server_connected: BoolProperty(default=False, options={'HIDDEN'})
     last_check: StringProperty(name="Last Check", default="")
 
+    # Job counts for the panel header, refreshed by update_job_counts() when jobs change
+    completed_count: IntProperty(default=0, options={'HIDDEN'})
+    pending_count: IntProperty(default=0, options={'HIDDEN'})
+    new_count: IntProperty(default=0, options={'HIDDEN'})
+
+def new_session(retries=3):
+    """Create the HTTP session shared by all operators and background threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=retries, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Keeps connections alive between requests instead of reconnecting for every call
+_SESSION = new_session()
+# For requests that already retry themselves (long-poll backoff, resumable upload)
+# or stream a body, where adapter retries would stack on top of ours, and for
+# checks blocking the UI, which must give up after a single timeout
+_STREAM_SESSION = new_session(retries=0)
+
+def new_executor():
+    """Create the worker pool running uploads and downloads"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='remote-render')
+
+# Set on unregister so background threads exit instead of touching freed add-on data
+_STOP = threading.Event()
+
+# Bounded pool for short-lived transfers, the subscriber and poller keep their own threads
+_EXEC = new_executor()
+
+# job_id -> RemoteRenderJob, read by the background threads
+_JOB_INDEX = {}
+_JOB_INDEX_LOCK = threading.Lock()
+# False while a file load or undo/redo reallocates scene data, a missing job then doesn't mean it was removed
+_JOB_INDEX_READY = False
+# job_id -> server payload that arrived while the index wasn't ready, applied once it is
+_DEFERRED_UPDATES = {}
+
+def rebuild_job_index():
+    """Index the jobs of every scene by ID, call after every add/remove since Blender may move collection items"""
+    global _JOB_INDEX_READY
+    with _JOB_INDEX_LOCK:
+        _JOB_INDEX.clear()
+        for scene in bpy.data.scenes:
+            for job in scene.server_integrated_settings.jobs:
+                _JOB_INDEX[job.job_id] = job
+        _JOB_INDEX_READY = True
+
+def clear_job_index():
+    """Hide all jobs from the background threads until the index is rebuilt"""
+    global _JOB_INDEX_READY
+    with _JOB_INDEX_LOCK:
+        _JOB_INDEX.clear()
+        _DEFERRED_UPDATES.clear()
+        _JOB_INDEX_READY = False
+
+def find_job(job_id):
+    """Find a tracked job by its server ID"""
+    with _JOB_INDEX_LOCK:
+        return _JOB_INDEX.get(job_id)
+
+def find_job_or_defer(job_id, job_data):
+    """Find a tracked job for an update, keeping the update for later while the index is rebuilt"""
+    with _JOB_INDEX_LOCK:
+        if not _JOB_INDEX_READY:
+            _DEFERRED_UPDATES[job_id] = job_data
+            return None
+        return _JOB_INDEX.get(job_id)
+
+def apply_deferred_updates():
+    """Apply updates received while the index was being rebuilt, main thread only"""
+    with _JOB_INDEX_LOCK:
+        updates = list(_DEFERRED_UPDATES.items())
+        _DEFERRED_UPDATES.clear()
+
+    for job_id, job_data in updates:
+        job = find_job(job_id)
+        if job:
+            apply_job_update(job, job_data)
+
+def job_settings(job):
+    """Settings of the scene a job belongs to"""
+    return job.id_data.server_integrated_settings
+
+def pending_job_ids(server_url):
+    """IDs of unfinished jobs submitted to a server"""
+    with _JOB_INDEX_LOCK:
+        jobs = list(_JOB_INDEX.items())
+    return [job_id for job_id, job in jobs if not job.is_complete and job_settings(job).server_url == server_url]
+
+def update_job_counts(settings):
+    """Refresh the cached job counts shown in the panel in a single pass"""
+    completed = pending = new = 0
+    for job in settings.jobs:
+        if job.is_complete:
+            completed += 1
+        else:
+            pending += 1
+        if job.has_notification:
+            new += 1
+
+    settings.completed_count = completed
+    settings.pending_count = pending
+    settings.new_count = new
+
+def watch_pending_jobs(settings):
+    """Follow the unfinished jobs of a scene"""
+    pending = [job.job_id for job in settings.jobs if not job.is_complete]
+    if pending:
+        watch_jobs(settings, pending)
+
+def migrate_job_status(settings):
+    """Convert statuses saved as strings by older versions to the status enum"""
+    for job in settings.jobs:
+        legacy_status = job.get('status')
+        if isinstance(legacy_status, str):
+            del job['status']
+            job.status = legacy_status if legacy_status in JOB_STATUSES else 'UNKNOWN'
+
+def migrate_server_status(settings):
+    """Derive the connected flag for files saved before it existed, which only stored the status text"""
+    if settings.get('server_connected') is None:
+        settings.server_connected = settings.server_status == "Connected ✓"
+
+@persistent
+def on_load_pre(dummy):
+    """Stop following jobs before the current file's data is freed"""
+    stop_watching()
+    clear_job_index()
+
+@persistent
+def on_load_post(dummy):
+    """Index the jobs stored in a newly loaded file and resume following unfinished ones"""
+    rebuild_job_index()
+    refresh_properties_areas()
+
+    for scene in bpy.data.scenes:
+        settings = scene.server_integrated_settings
+        migrate_job_status(settings)
+        migrate_server_status(settings)
+        update_job_counts(settings)
+        watch_pending_jobs(settings)
+    apply_deferred_updates()
+
+@persistent
+def on_undo_pre(dummy):
+    """Hide jobs from the background threads while undo/redo reallocates scene data"""
+    clear_job_index()
+
+@persistent
+def on_undo_post(dummy):
+    """Re-index jobs, undo/redo leaves the previously indexed pointers dangling"""
+    rebuild_job_index()
+    apply_deferred_updates()
+    for scene in bpy.data.scenes:
+        watch_pending_jobs(scene.server_integrated_settings)
+
+def app_handlers():
+    """(handler list, callback) pairs installed by the add-on"""
+    handlers = bpy.app.handlers
+    return [
+        (handlers.load_pre, on_load_pre),
+        (handlers.load_post, on_load_post),
+        (handlers.undo_pre, on_undo_pre),
+        (handlers.redo_pre, on_undo_pre),
+        (handlers.undo_post, on_undo_post),
+        (handlers.redo_post, on_undo_post),
+    ]
+
+# Properties editors of all windows keyed by pointer, the only areas showing the panel
+_PROPERTIES_AREAS = {}
+_AREAS_KEY = None  # (screen pointer, area count) per window the cache was built for
+
+def properties_areas_key(wm):
+    """Changes whenever a window's screen is switched or its areas are split/joined"""
+    return tuple((window.screen.as_pointer(), len(window.screen.areas)) for window in wm.windows)
+
+def refresh_properties_areas():
+    """Cache the Properties editors of every window so redraws can skip all other areas"""
+    global _AREAS_KEY
+    wm = bpy.context.window_manager
+    if wm is None:
+        return  # No window context, keep what we have
+
+    _PROPERTIES_AREAS.clear()
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'PROPERTIES':
+                _PROPERTIES_AREAS[area.as_pointer()] = area
+    _AREAS_KEY = properties_areas_key(wm)
+
+# Set by background threads when job data changed, consumed by flush_ui() on the main thread
+_ui_dirty = threading.Event()
+
+def flush_ui():
+    """Persistent timer redrawing the Properties editors at most every 100ms while jobs change"""
+    if _ui_dirty.is_set():
+        _ui_dirty.clear()
+        try:
+            wm = bpy.context.window_manager
+            # Switching screens or splitting/joining areas invalidates the cached areas
+            if wm is not None and properties_areas_key(wm) != _AREAS_KEY:
+                refresh_properties_areas()
+            for area in _PROPERTIES_AREAS.values():
+                area.tag_redraw()
+        except:
+            pass
+    return 0.1
+
+def apply_job_update(job, job_data):
+    """Copy a server job payload onto a tracked job, returns True once the job is finished"""
+    new_status = job_data.get('status', 'UNKNOWN')
+    if new_status not in JOB_STATUSES:
+        new_status = 'UNKNOWN'
+    try:
+        progress = max(0, min(100, int(job_data.get('progress') or 0)))  # null while queued
+    except (TypeError, ValueError):
+        progress = job.progress
+    error_message = job_data.get('errorMessage')
+
+    # Only write what actually changed, every property write fires RNA notifiers
+    changed = False
+    if job.status != new_status:
+        job.status = new_status
+        changed = True
+    if job.progress != progress:
+        job.progress = progress
+        changed = True
+    if error_message and job.error_message != error_message:
+        job.error_message = error_message
+        changed = True
+
+    if new_status in ['COMPLETED', 'FAILED'] and not job.is_complete:
+        settings = job_settings(job)
+        job.is_complete = True
+        job.has_notification = True
+        update_job_counts(settings)
+        changed = True
+
+        if new_status == 'COMPLETED' and settings.show_notifications:
+            show_completion_notification(job.scene_name)
+        elif new_status == 'FAILED':
+            show_failure_notification(job.scene_name, job.error_message)
+
+    if changed:
+        _ui_dirty.set()
+    return job.is_complete
+
+class _Poller:
+    """Single background thread polling all tracked jobs with one batched request per server"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.job_ids = set()
+        self.stop = None  # Stop event the poll thread was started with
+        self.etags = {}  # server URL -> (ids query, ETag) of the last full response
+
+    def track(self, job_ids):
+        """Add jobs to the next poll cycles, starting the poll thread if none is running"""
+        with self.lock:
+            self.job_ids.update(job_ids)
+            if self.stop is None or self.stop.is_set():
+                self.stop = _STOP
+                thread = threading.Thread(target=self.run, args=(self.stop,))
+                thread.daemon = True
+                thread.start()
+
+    def reset(self):
+        """Forget all tracked jobs"""
+        with self.lock:
+            self.job_ids.clear()
+            self.etags.clear()
+
+    def run(self, stop):
+        attempt = 0
+        while not stop.is_set():
+            with self.lock:
+                job_ids = sorted(self.job_ids)
+
+            if not job_ids:
+                stop.wait(5)
+                continue
+
+            started = time.time()
+            try:
+                self.poll(job_ids, stop)
+                attempt = 0
+            except Exception:
+                attempt += 1
+                stop.wait(min(60, 2 ** attempt))
+                continue
+
+            # An immediate answer means the server doesn't hold the request open,
+            # so fall back to polling at a fixed interval
+            if time.time() - started < 1:
+                stop.wait(5)
+
+    def poll(self, job_ids, stop):
+        """Long-poll all tracked jobs, grouped by the server of the scene they belong to"""
+        with _JOB_INDEX_LOCK:
+            if not _JOB_INDEX_READY:
+                return  # Scene data is being reallocated, keep every job tracked
+            jobs = {job_id: _JOB_INDEX.get(job_id) for job_id in job_ids}
+
+        done = set()
+        by_server = {}
+        for job_id, job in jobs.items():
+            if job is None:
+                done.add(job_id)  # Removed from the list
+            else:
+                by_server.setdefault(job_settings(job).server_url, []).append(job_id)
+
+        try:
+            for server_url, server_job_ids in by_server.items():
+                done |= self.poll_server(server_url, server_job_ids, stop)
+        finally:
+            with self.lock:
+                self.job_ids -= done
+
+    def poll_server(self, server_url, job_ids, stop, wait=True):
+        """Long-poll one server for a batch of jobs, returns the IDs that finished"""
+        query = ','.join(job_ids)
+        params = {'ids': query}
+        headers = {}
+        if wait:
+            params['wait_ms'] = 25000
+            etag = self.etags.get(server_url)
+            if etag and etag[0] == query:
+                headers['If-None-Match'] = etag[1]
+
+        # Server holds the request for up to 25s; the 30s read timeout stays below
+        # common proxy/NAT idle limits so a dead connection can't hang us forever
+        response = _STREAM_SESSION.get(
+            f"{server_url}/api/jobs",
+            params=params,
+            headers=headers,
+            timeout=(5, 30)
+        )
+        if response.status_code == 304:
+            return set()  # Nothing changed while waiting
+        response.raise_for_status()
+
+        if stop.is_set():
+            return set()  # Add-on was disabled while waiting
+
+        if 'ETag' in response.headers:
+            self.etags[server_url] = (query, response.headers['ETag'])
+
+        done = set()
+        for job_data in _loads(response.content):
+            # A malformed entry must not hold back the rest of the batch
+            if not isinstance(job_data, dict):
+                continue
+            job_id = str(job_data.get('id'))
+            try:
+                # Looked up again, another file may have been loaded or an undo step taken while waiting
+                job = find_job_or_defer(job_id, job_data)
+                if job and apply_job_update(job, job_data):
+                    done.add(job_id)
+            except Exception:
+                continue
+        return done
+
+_POLLER = _Poller()
+
+def show_completion_notification(scene_name):
+    """Show system notification for completion"""
+    if _NOTIFY:
+        _NOTIFY(
+            title="Render Complete! 🎉",
+            message=f"Scene '{scene_name}' has finished rendering",
+            timeout=10
+        )
+    else:
+        show_blender_notification('INFO', f"🎉 Render Complete: {scene_name}")
+
+def show_failure_notification(scene_name, error_message):
+    """Show system notification for failure"""
+    if _NOTIFY:
+        _NOTIFY(
+            title="Render Failed ❌",
+            message=f"Scene '{scene_name}' failed: {error_message[:50]}...",
+            timeout=10
+        )
+    else:
+        show_blender_notification('ERROR', f"❌ Render Failed: {scene_name} - {error_message[:50]}")
+
+def show_blender_notification(level, message):
+    """Show notification in Blender's interface"""
+    def show_notification():
+        try:
+            bpy.ops.wm.report({level}, message)
+        except:
+            print(f"[{level}] {message}")
+
+    bpy.app.timers.register(show_notification, first_interval=0.1)
+
+_TEMP_LOCK = threading.Lock()
+_TEMP_SLOT = None  # Temp .blend path reused by this Blender process
+_TEMP_SLOT_BUSY = False
+
+def remove_temp_file(path):
+    """Delete a temp file if it is still there"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def acquire_temp_blend():
+    """Get a temp .blend path, reusing this process' slot unless an upload still holds it"""
+    global _TEMP_SLOT, _TEMP_SLOT_BUSY
+    with _TEMP_LOCK:
+        if _TEMP_SLOT and not _TEMP_SLOT_BUSY:
+            _TEMP_SLOT_BUSY = True
+            return _TEMP_SLOT
+
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix='.blend', prefix=f'remote_render_{os.getpid()}_')
+        temp.close()
+        # Only the unique name is needed, saving over an existing file would leave a .blend1 backup
+        os.remove(temp.name)
+        atexit.register(remove_temp_file, temp.name)
+
+        if _TEMP_SLOT is None:
+            _TEMP_SLOT = temp.name
+            _TEMP_SLOT_BUSY = True
+        return temp.name
+
+def release_temp_blend(path):
+    """Remove a temp .blend once its upload is done and free the slot"""
+    global _TEMP_SLOT_BUSY
+    remove_temp_file(path)
+    with _TEMP_LOCK:
+        if path == _TEMP_SLOT:
+            _TEMP_SLOT_BUSY = False
+
+def chunk_generator(f, offset=0, size=4 * 1024 * 1024, stop=None):
+    """Read an open file in fixed-size blocks so uploads never hold it in memory"""
+    f.seek(offset)
+    while chunk := f.read(size):
+        if stop is not None and stop.is_set():
+            raise InterruptedError("Upload cancelled")
+        yield chunk
+
+class _JobSubscriber:
+    """Single WebSocket connection that receives status updates for every job on a server"""
+
+    def __init__(self, server_url):
+        self.server_url = server_url
+        self.state = 'CONNECTING'  # CONNECTING, OPEN or FAILED
+        self.stop = _STOP
+        self.closed = False
+        self.was_open = False
+        self.app = None
+
+    def start(self):
+        thread = threading.Thread(target=self.run)
+        thread.daemon = True
+        thread.start()
+
+    def run(self):
+        url = self.server_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        self.app = websocket.WebSocketApp(
+            f"{url}/ws/jobs",
+            on_open=self.on_open,
+            on_message=self.on_message,
+        )
+
+        while not self.closed and not self.stop.is_set():
+            self.app.run_forever(ping_interval=30)
+            if self.closed or self.stop.is_set():
+                break
+            if self.state != 'OPEN':
+                self.fall_back()  # Handshake failed, server has no WebSocket support
+                break
+            # Connection dropped after working fine, try to reconnect
+            self.state = 'CONNECTING'
+            self.stop.wait(5)
+
+    def on_open(self, ws):
+        self.state = 'OPEN'
+        if self.was_open:
+            self.resync()
+        self.was_open = True
+
+    def resync(self):
+        """Fetch pending jobs once after a reconnect, frames sent while disconnected are lost"""
+        job_ids = pending_job_ids(self.server_url)
+        if not job_ids:
+            return
+
+        try:
+            _POLLER.poll_server(self.server_url, job_ids, self.stop, wait=False)
+        except Exception:
+            _POLLER.track(job_ids)  # Let the poller retry with its backoff
+
+    def on_message(self, ws, message):
+        if self.closed or self.stop.is_set():
+            return
+
+        try:
+            job_data = _loads(message)
+        except ValueError:
+            return
+        if not isinstance(job_data, dict):
+            return
+
+        job = find_job_or_defer(str(job_data.get('id')), job_data)
+        if job:
+            apply_job_update(job, job_data)
+
+    def fall_back(self):
+        """Switch every pending job on this server over to HTTP polling"""
+        self.state = 'FAILED'
+        _POLLER.track(pending_job_ids(self.server_url))
+
+    def close(self):
+        self.closed = True
+        if self.app:
+            self.app.close()
+
+# Server URL -> subscriber, scenes may submit to different servers
+_SUBSCRIBERS = {}
+
+def ensure_subscriber(server_url):
+    """Connect a job subscriber to a server, returns None without websocket-client"""
+    if websocket is None:
+        return None
+
+    subscriber = _SUBSCRIBERS.get(server_url)
+    if subscriber is None:
+        subscriber = _SUBSCRIBERS[server_url] = _JobSubscriber(server_url)
+        subscriber.start()
+
+    return subscriber
+
+def watch_jobs(settings, job_ids):
+    """Follow jobs over the WebSocket, or with the poller when that isn't available"""
+    subscriber = ensure_subscriber(settings.server_url)
+    if subscriber is None or subscriber.state == 'FAILED':
+        _POLLER.track(job_ids)
+
+def stop_watching():
+    """Close all subscribers and forget the polled jobs, they belong to the current file"""
+    for subscriber in _SUBSCRIBERS.values():
+        subscriber.close()
+    _SUBSCRIBERS.clear()
+    _POLLER.reset()
+
+_PLATFORM = sys.platform
+
+def open_directory(path):
+    """Show a directory in the system file manager without going through a shell"""
+    if _PLATFORM == 'win32':
+        os.startfile(path)
+    elif _PLATFORM == 'darwin':
+        subprocess.Popen(['open', path], start_new_session=True)
+    else:  # Linux, BSDs and other POSIX desktops
+        subprocess.Popen(['xdg-open', path], start_new_session=True)
+
+def set_download_message(job_id, message, failed=False):
+    """Show the outcome of a download on its job, reports can't be raised from worker threads"""
+    job = find_job(job_id)
+    if job:
+        job.download_message = message
+        job.download_failed = failed
+        _ui_dirty.set()
+
+def download_results(job_id, url, download_dir):
+    """Stream a job's results to disk in a background thread"""
+    filename = f"render_job_{job_id}.zip"
+    filepath = os.path.join(download_dir, filename)
+    part_path = None
+    stop = _STOP
+
+    try:
+        # Read timeout is the longest gap between chunks, it bounds how long a stalled
+        # download can keep the non-daemon worker, and so Blender's quit, waiting
+        with _STREAM_SESSION.get(url, stream=True, timeout=(5, 20)) as response:
+            if response.status_code != 200:
+                set_download_message(job_id, f"Download failed: {response.status_code}", failed=True)
+                return
+
+            # Written under a unique temporary name and renamed when complete, so a half-written
+            # ZIP is never visible, not even to a second download of the same job. Created with
+            # open() rather than mkstemp() so the published file gets the umask's permissions
+            f = open(os.path.join(download_dir, f"{filename}.{uuid.uuid4().hex}.part"), 'xb')
+            part_path = f.name
+
+            total = int(response.headers.get('Content-Length', 0))
+            written = 0
+            with f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    if stop.is_set():
+                        # Add-on is being disabled, the partial file is removed below
+                        raise InterruptedError("Download cancelled")
+                    f.write(chunk)
+                    written += len(chunk)
+
+                    job = find_job(job_id)
+                    percent = int(100 * written / total) if total else 0
+                    if job and job.download_progress != percent:
+                        job.download_progress = percent
+                        _ui_dirty.set()
+
+                f.flush()
+                os.fsync(f.fileno())
+
+        os.replace(part_path, filepath)
+
+        job = find_job(job_id)
+        if job:
+            job.download_progress = 100
+            job.has_notification = False
+            update_job_counts(job_settings(job))  # Not a captured settings, the file may have been reverted
+
+        set_download_message(job_id, f"Saved to: {filepath}")
+
+        try:
+            open_directory(download_dir)
+        except OSError:
+            pass  # No file manager available, the download itself succeeded
+
+    except Exception as e:
+        if part_path:
+            remove_temp_file(part_path)
+        set_download_message(job_id, f"Download error: {str(e)}", failed=True)
+
 class INTEGRATED_OT_test_connection(Operator):
     """Test connection to render server"""
     bl_idname = "integrated.test_connection"
@@ -78,12 +749,15 @@ class INTEGRATED_OT_test_connection(Operator):
 
     def execute(self, context):
         settings = context.scene.server_integrated_settings
+        settings.server_connected = False
 
         try:
-            response = requests.get(f"{settings.server_url}/health", timeout=5)
+            # Blocks the UI, a single attempt keeps an unreachable server from freezing it for retries
+            response = _STREAM_SESSION.get(f"{settings.server_url}/health", timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 settings.server_status = "Connected ✓"
+                settings.server_connected = True
                 settings.last_check = time.strftime("%H:%M:%S")
                 self.report({'INFO'}, f"Server connection successful! Status: {data.get('status', 'unknown')}")
             else:
@@ -101,130 +775,288 @@ class INTEGRATED_OT_test_connection(Operator):
 
         return {'FINISHED'}
 
+# Job request bodies, copied and patched with the per-submission fields
+_FAST_TEMPLATE = {
+    "fileName": None,
+    "quality": "FAST",
+    "startFrame": None,
+    "endFrame": None,
+    "resolutionX": None,
+    "resolutionY": None,
+    "outputFormat": "PNG",
+    "description": None,
+}
+_HIGH_TEMPLATE = dict(_FAST_TEMPLATE, quality="HIGH")
+_PRESET_TEMPLATES = {'FAST': _FAST_TEMPLATE, 'HIGH': _HIGH_TEMPLATE}
+
+_CUSTOM_TEMPLATE = {
+    "fileName": None,
+    "renderSettings": None,
+    "description": None,
+}
+_CUSTOM_RENDER_SETTINGS = {
+    "startFrame": None,
+    "endFrame": None,
+    "resolutionX": None,
+    "resolutionY": None,
+    "samples": None,
+    "outputFormat": "PNG",
+    "renderEngine": None,
+    "deviceType": "AUTO",
+}
+
+def record_submitted_job(scene, scene_name, job_result):
+    """Add a job the server accepted to a scene's list and start following it"""
+    settings = scene.server_integrated_settings
+    new_job = settings.jobs.add()
+    new_job.job_id = job_result.get('id', 'unknown')
+    new_job.scene_name = scene_name
+    new_job.submitted_time = time.strftime("%H:%M")
+    new_job.status = "SUBMITTED"
+    rebuild_job_index()
+    update_job_counts(settings)
+
+    watch_jobs(settings, [new_job.job_id])
+    return new_job
+
+def record_when_done(worker, filepath, scene_key, scene_name):
+    """Timer recording the job of an aborted submit operator once its upload finishes"""
+    if not worker.done():
+        return 0.5
+
+    job_result = worker.result()
+    scene = bpy.data.scenes.get(scene_key)
+    # After another file was loaded a scene with the same name is not the one that was submitted
+    if job_result and scene is not None and bpy.data.filepath == filepath:
+        record_submitted_job(scene, scene_name, job_result)
+    return None
+
 class INTEGRATED_OT_submit_render(Operator):
     """Submit current scene for remote rendering"""
     bl_idname = "integrated.submit_render"
     bl_label = "Render on Server"
     bl_description = "Submit current scene to server and continue working"
 
-    def execute(self, context):
+    def invoke(self, context, event):
         settings = context.scene.server_integrated_settings
 
-        try:
-            self.report({'INFO'}, "Preparing scene for upload...")
-            temp_blend_file = self.save_scene_to_temp()
+        # Everything touching bpy data is read here, the worker thread only does network I/O
+        self.server_url = settings.server_url
+        self.scene_name = self.get_scene_name()
+        # The job belongs to the scene that was submitted, not whichever is active when it's done
+        self.scene_key = context.scene.name
+        self.filepath = bpy.data.filepath
+        self.endpoint, self.job_data = self.build_job_data(settings, context.scene)
+        self.worker = None
+        self.error = None
+        self.stop = _STOP
+
+        self.report({'INFO'}, "Preparing scene for upload...")
+        wm = context.window_manager
+        if context.window is not None:
+            self._timer = wm.event_timer_add(0.1, window=context.window)
+            if wm.modal_handler_add(self):
+                return {'RUNNING_MODAL'}
+            wm.event_timer_remove(self._timer)
+
+        # Background mode (blender -b) has no window to run modal in, submit right away
+        return self.submit_blocking(context)
+
+    def execute(self, context):
+        # Scripts and F3 search call execute, run the same path, which blocks only without a window
+        return self.invoke(context, None)
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self.worker is None:
+            # Saving has to happen on the main thread, upload and submission don't
+            try:
+                blend_file = self.save_scene_to_temp()
+            except Exception as e:
+                self.report({'ERROR'}, f"Error saving scene: {str(e)}")
+                return self.finish(context, {'CANCELLED'})
 
             self.report({'INFO'}, "Uploading scene to server...")
-            upload_result = self.upload_file(settings.server_url, temp_blend_file)
-            if not upload_result:
-                return {'CANCELLED'}
+            self.worker = _EXEC.submit(self.upload_and_submit, blend_file)
+            return {'PASS_THROUGH'}
 
-            self.report({'INFO'}, "Submitting render job...")
-            job_result = self.submit_render_job(settings, upload_result)
-            if not job_result:
-                return {'CANCELLED'}
+        if not self.worker.done():
+            return {'PASS_THROUGH'}
 
-            new_job = settings.jobs.add()
-            new_job.job_id = job_result.get('id', 'unknown')
-            new_job.scene_name = self.get_scene_name()
-            new_job.submitted_time = time.strftime("%H:%M")
-            new_job.status = "SUBMITTED"
+        return self.finish(context, self.submitted(context, self.worker.result()))
 
-            monitor_thread = threading.Thread(target=self.monitor_job, args=(context, new_job.job_id))
-            monitor_thread.daemon = True
-            monitor_thread.start()
+    def cancel(self, context):
+        # Blender aborts modal operators when a file is loaded or the window is closed
+        context.window_manager.event_timer_remove(self._timer)
+        if self.worker is not None:
+            worker, filepath, scene_key, scene_name = self.worker, self.filepath, self.scene_key, self.scene_name
+            bpy.app.timers.register(lambda: record_when_done(worker, filepath, scene_key, scene_name))
 
-            self.report({'INFO'}, f"Render submitted successfully! Job ID: {new_job.job_id}")
-            return {'FINISHED'}
+    def finish(self, context, result):
+        context.window_manager.event_timer_remove(self._timer)
+        return result
 
+    def submit_blocking(self, context):
+        """Save, upload and submit on the calling thread"""
+        try:
+            blend_file = self.save_scene_to_temp()
         except Exception as e:
-            self.report({'ERROR'}, f"Error submitting job: {str(e)}")
+            self.report({'ERROR'}, f"Error saving scene: {str(e)}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Uploading scene to server...")
+        return self.submitted(context, self.upload_and_submit(blend_file))
+
+    def submitted(self, context, job_result):
+        """Record the job the server created, or report why there is none"""
+        if not job_result:
+            self.report({'ERROR'}, self.error or "Error submitting job")
             return {'CANCELLED'}
 
+        scene = bpy.data.scenes.get(self.scene_key, context.scene)
+        new_job = record_submitted_job(scene, self.scene_name, job_result)
+
+        self.report({'INFO'}, f"Render submitted successfully! Job ID: {new_job.job_id}")
+        return {'FINISHED'}
+
+    def upload_and_submit(self, blend_file):
+        """Upload the saved scene and create the render job, returns the server's job or None"""
+        try:
+            upload_result = self.upload_file(self.server_url, blend_file)
+            if upload_result and not self.stop.is_set():
+                return self.submit_render_job(upload_result)
+        except Exception as e:
+            self.error = f"Error submitting job: {str(e)}"
+        return None
+
     def save_scene_to_temp(self):
-        """Save current scene to a temporary .blend file"""
-        temp_dir = tempfile.gettempdir()
-        temp_filename = f"remote_render_{int(time.time())}.blend"
-        temp_path = os.path.join(temp_dir, temp_filename)
+        """Save current scene to a temporary .blend file and open it for upload"""
+        temp_path = acquire_temp_blend()
 
-        bpy.ops.wm.save_as_mainfile(filepath=temp_path, copy=True)
-        return temp_path
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=temp_path, copy=True)
+            blend_file = open(temp_path, 'rb')
+        except Exception:
+            release_temp_blend(temp_path)
+            raise
+
+        if os.name == 'posix':
+            # The open handle keeps the data readable, so nothing is left behind on a crash
+            os.unlink(temp_path)
+        return blend_file
+
+    def upload_file(self, server_url, blend_file):
+        """Stream .blend file to server, resuming where it stopped if the connection drops"""
+        url = f"{server_url}/api/files/upload/stream"
+        upload_id = uuid.uuid4().hex
+        offset = 0
 
-    def upload_file(self, server_url, file_path):
-        """Upload .blend file to server"""
         try:
-            with open(file_path, 'rb') as f:
-                files = {'file': (os.path.basename(file_path), f, 'application/octet-stream')}
-                response = requests.post(f"{server_url}/api/files/upload", files=files, timeout=60)
+            headers = {
+                'Content-Type': 'application/octet-stream',
+                'X-Filename': os.path.basename(blend_file.name),
+                'Upload-Id': upload_id,
+                'Upload-Length': str(os.fstat(blend_file.fileno()).st_size),
+            }
+
+            for attempt in range(3):
+                try:
+                    headers['Upload-Offset'] = str(offset)
+                    response = _STREAM_SESSION.post(
+                        url,
+                        data=chunk_generator(blend_file, offset, stop=self.stop),
+                        headers=headers,
+                        timeout=(5, 30)
+                    )
+                    break
+                except requests.exceptions.ConnectionError:
+                    if attempt == 2 or self.stop.is_set():
+                        raise
+                    offset = self.get_upload_offset(url, upload_id)
 
             if response.status_code in [200, 201]:
-                return response.json()
+                return _loads(response.content)
             else:
-                self.report({'ERROR'}, f"Upload failed: {response.status_code}")
+                self.error = f"Upload failed: {response.status_code}"
                 return None
 
         except Exception as e:
-            self.report({'ERROR'}, f"Upload error: {str(e)}")
+            self.error = f"Upload error: {str(e)}"
             return None
         finally:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            blend_file.close()
+            release_temp_blend(blend_file.name)
 
-    def submit_render_job(self, settings, upload_result):
-        """Submit render job to server"""
-        scene = bpy.context.scene
-        
+    def get_upload_offset(self, url, upload_id):
+        """Ask the server how many bytes of an interrupted upload it has received"""
+        try:
+            response = _SESSION.head(f"{url}/{upload_id}", timeout=10)
+            if response.status_code == 200:
+                return int(response.headers.get('Upload-Offset', 0))
+        except Exception:
+            pass
+        return 0
+
+    def build_job_data(self, settings, scene):
+        """Build the render job request, the file name is filled in after upload"""
         # Check if using quality preset or custom settings
-        if settings.render_quality in ['FAST', 'HIGH']:
+        if settings.render_quality in _PRESET_TEMPLATES:
             # Use the new preset endpoint
-            job_data = {
-                "fileName": upload_result.get('fileName', 'unknown.blend'),
-                "quality": settings.render_quality,
-                "startFrame": settings.start_frame,
-                "endFrame": settings.end_frame,
-                "resolutionX": scene.render.resolution_x,
-                "resolutionY": scene.render.resolution_y,
-                "outputFormat": "PNG",
-                "description": f"Blender render job from {self.get_scene_name()} ({settings.render_quality} quality)"
-            }
+            job_data = _PRESET_TEMPLATES[settings.render_quality].copy()
+            job_data.update(
+                startFrame=settings.start_frame,
+                endFrame=settings.end_frame,
+                resolutionX=scene.render.resolution_x,
+                resolutionY=scene.render.resolution_y,
+                description=f"Blender render job from {self.scene_name} ({settings.render_quality} quality)"
+            )
             
             endpoint = f"{settings.server_url}/api/presets/render"
             
         else:
             # Use the original custom settings endpoint
-            job_data = {
-                "fileName": upload_result.get('fileName', 'unknown.blend'),
-                "renderSettings": {
-                    "startFrame": settings.start_frame,
-                    "endFrame": settings.end_frame,
-                    "resolutionX": scene.render.resolution_x,
-                    "resolutionY": scene.render.resolution_y,
-                    "samples": scene.cycles.samples if scene.render.engine == 'CYCLES' else None,
-                    "outputFormat": "PNG",
-                    "renderEngine": scene.render.engine,
-                    "deviceType": "AUTO"
-                },
-                "description": f"Blender render job from {self.get_scene_name()}"
-            }
+            render_settings = _CUSTOM_RENDER_SETTINGS.copy()
+            render_settings.update(
+                startFrame=settings.start_frame,
+                endFrame=settings.end_frame,
+                resolutionX=scene.render.resolution_x,
+                resolutionY=scene.render.resolution_y,
+                samples=scene.cycles.samples if scene.render.engine == 'CYCLES' else None,
+                renderEngine=scene.render.engine
+            )
+
+            job_data = _CUSTOM_TEMPLATE.copy()
+            job_data.update(
+                renderSettings=render_settings,
+                description=f"Blender render job from {self.scene_name}"
+            )
             
             endpoint = f"{settings.server_url}/api/jobs"
 
+        return endpoint, job_data
+
+    def submit_render_job(self, upload_result):
+        """Submit render job to server"""
+        self.job_data["fileName"] = upload_result.get('fileName', 'unknown.blend')
+
         try:
-            response = requests.post(
-                endpoint,
-                json=job_data,
+            response = _SESSION.post(
+                self.endpoint,
+                data=_dumps(self.job_data),
                 headers={'Content-Type': 'application/json'},
                 timeout=30
             )
 
             if response.status_code in [200, 201]:
-                return response.json()
+                return _loads(response.content)
             else:
-                self.report({'ERROR'}, f"Job submission failed: {response.status_code}")
+                self.error = f"Job submission failed: {response.status_code}"
                 return None
 
         except Exception as e:
-            self.report({'ERROR'}, f"Job submission error: {str(e)}")
+            self.error = f"Job submission error: {str(e)}"
             return None
 
     def get_scene_name(self):
@@ -234,92 +1066,6 @@ class INTEGRATED_OT_submit_render(Operator):
         else:
             return "Untitled.blend"
 
-    def monitor_job(self, context, job_id):
-        """Monitor job progress in background thread"""
-        settings = context.scene.server_integrated_settings
-
-        while True:
-            try:
-                job = None
-                for j in settings.jobs:
-                    if j.job_id == job_id:
-                        job = j
-                        break
-
-                if not job:
-                    break  # Job was removed
-
-                response = requests.get(f"{settings.server_url}/api/jobs/{job_id}", timeout=10)
-                if response.status_code == 200:
-                    job_data = response.json()
-
-                    new_status = job_data.get('status', 'UNKNOWN')
-                    job.status = new_status
-                    job.progress = int(job_data.get('progress', 0))
-
-                    if 'errorMessage' in job_data and job_data['errorMessage']:
-                        job.error_message = job_data['errorMessage']
-
-                    def update_ui():
-                        try:
-                            for area in bpy.context.screen.areas:
-                                area.tag_redraw()
-                        except:
-                            pass
-
-                    bpy.app.timers.register(update_ui, first_interval=0.1)
-
-                    if new_status in ['COMPLETED', 'FAILED']:
-                        job.is_complete = True
-                        job.has_notification = True
-
-                        if new_status == 'COMPLETED' and settings.show_notifications:
-                            self.show_completion_notification(job.scene_name)
-                        elif new_status == 'FAILED':
-                            self.show_failure_notification(job.scene_name, job.error_message)
-
-                        bpy.app.timers.register(update_ui, first_interval=0.1)
-                        break
-
-                time.sleep(5)
-
-            except Exception:
-                time.sleep(10)
-
-    def show_completion_notification(self, scene_name):
-        """Show system notification for completion"""
-        try:
-            import plyer
-            plyer.notification.notify(
-                title="Render Complete! 🎉",
-                message=f"Scene '{scene_name}' has finished rendering",
-                timeout=10
-            )
-        except ImportError:
-            self.show_blender_notification('INFO', f"🎉 Render Complete: {scene_name}")
-
-    def show_failure_notification(self, scene_name, error_message):
-        """Show system notification for failure"""
-        try:
-            import plyer
-            plyer.notification.notify(
-                title="Render Failed ❌",
-                message=f"Scene '{scene_name}' failed: {error_message[:50]}...",
-                timeout=10
-            )
-        except ImportError:
-            self.show_blender_notification('ERROR', f"❌ Render Failed: {scene_name} - {error_message[:50]}")
-
-    def show_blender_notification(self, level, message):
-        """Show notification in Blender's interface"""
-        def show_notification():
-            try:
-                bpy.ops.wm.report({level}, message)
-            except:
-                print(f"[{level}] {message}")
-
-        bpy.app.timers.register(show_notification, first_interval=0.1)
-
 class INTEGRATED_OT_download_job(Operator):
     """Download completed render"""
     bl_idname = "integrated.download_job"
@@ -331,35 +1077,16 @@ class INTEGRATED_OT_download_job(Operator):
     def execute(self, context):
         settings = context.scene.server_integrated_settings
 
-        try:
-            response = requests.get(f"{settings.server_url}/api/files/download/{self.job_id}", timeout=60)
-
-            if response.status_code == 200:
-                download_dir = self.get_download_directory()
-                filename = f"render_job_{self.job_id}.zip"
-                filepath = os.path.join(download_dir, filename)
-
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-
-                for job in settings.jobs:
-                    if job.job_id == self.job_id:
-                        job.has_notification = False
-                        break
+        job = find_job(self.job_id)
+        if job:
+            job.download_progress = 0
+            job.download_message = "Downloading..."
+            job.download_failed = False
 
-                self.report({'INFO'}, f"Results downloaded to: {filepath}")
-
-                if os.name == 'nt':  # Windows
-                    os.startfile(download_dir)
-                elif os.name == 'posix':  # macOS and Linux
-                    os.system(f'open "{download_dir}"' if os.uname().sysname == 'Darwin' else f'xdg-open "{download_dir}"')
-
-            else:
-                self.report({'ERROR'}, f"Download failed: {response.status_code}")
-
-        except Exception as e:
-            self.report({'ERROR'}, f"Download error: {str(e)}")
+        url = f"{settings.server_url}/api/files/download/{self.job_id}"
+        _EXEC.submit(download_results, self.job_id, url, self.get_download_directory())
 
+        self.report({'INFO'}, "Downloading results...")
         return {'FINISHED'}
 
     def get_download_directory(self):
@@ -384,6 +1111,8 @@ class INTEGRATED_OT_clear_job(Operator):
     def execute(self, context):
         settings = context.scene.server_integrated_settings
         settings.jobs.remove(self.job_index)
+        rebuild_job_index()
+        update_job_counts(settings)
         return {'FINISHED'}
 
 class INTEGRATED_OT_clear_all_jobs(Operator):
@@ -397,6 +1126,8 @@ class INTEGRATED_OT_clear_all_jobs(Operator):
         for i in range(len(settings.jobs) - 1, -1, -1):
             if settings.jobs[i].is_complete:
                 settings.jobs.remove(i)
+        rebuild_job_index()
+        update_job_counts(settings)
         return {'FINISHED'}
 
 class INTEGRATED_OT_refresh_ui(Operator):
@@ -420,12 +1151,17 @@ class INTEGRATED_PT_remote_render(Panel):
 
     def draw(self, context):
         layout = self.layout
-        settings = context.scene.server_integrated_settings
+        scene = context.scene
+        settings = scene.server_integrated_settings
+        render = scene.render
+
+        if context.area.as_pointer() not in _PROPERTIES_AREAS:
+            refresh_properties_areas()  # Editor was just switched to Properties
 
         self.draw_server_section(layout, settings)
         layout.separator()
 
-        self.draw_render_settings(layout, settings)
+        self.draw_render_settings(layout, settings, render)
         layout.separator()
 
         layout.operator("integrated.submit_render", icon='RENDER_ANIMATION', text="Render on Server")
@@ -445,7 +1181,7 @@ class INTEGRATED_PT_remote_render(Panel):
 
         if settings.server_status:
             status_col = status_row.column()
-            if "✓" in settings.server_status:
+            if settings.server_connected:
                 status_col.label(text=settings.server_status, icon='CHECKMARK')
             else:
                 status_col.alert = True
@@ -454,7 +1190,7 @@ class INTEGRATED_PT_remote_render(Panel):
             if settings.last_check:
                 box.label(text=f"Last check: {settings.last_check}")
 
-    def draw_render_settings(self, layout, settings):
+    def draw_render_settings(self, layout, settings, render):
         """Draw render settings section"""
         box = layout.box()
         box.label(text="Render Settings", icon='SETTINGS')
@@ -464,12 +1200,13 @@ class INTEGRATED_PT_remote_render(Panel):
         quality_row.prop(settings, "render_quality", expand=False)
         
         # Show quality preset info
-        if settings.render_quality == 'FAST':
+        render_quality = settings.render_quality
+        if render_quality == 'FAST':
             info_box = box.box()
             info_box.label(text="Fast Preset:", icon='INFO')
             info_box.label(text="• 64 samples, 4 light bounces")
             info_box.label(text="• Optimized for speed and previews")
-        elif settings.render_quality == 'HIGH':
+        elif render_quality == 'HIGH':
             info_box = box.box()
             info_box.label(text="High Quality Preset:", icon='INFO')
             info_box.label(text="• 1024 samples, 12 light bounces")
@@ -481,11 +1218,10 @@ class INTEGRATED_PT_remote_render(Panel):
         row.prop(settings, "start_frame")
         row.prop(settings, "end_frame")
 
-        scene = bpy.context.scene
         info_row = box.row()
-        info_row.label(text=f"Resolution: {scene.render.resolution_x}×{scene.render.resolution_y}")
+        info_row.label(text=f"Resolution: {render.resolution_x}×{render.resolution_y}")
         info_row = box.row()
-        info_row.label(text=f"Engine: {scene.render.engine}")
+        info_row.label(text=f"Engine: {render.engine}")
 
         box.prop(settings, "show_notifications")
 
@@ -497,22 +1233,21 @@ class INTEGRATED_PT_remote_render(Panel):
         header_row.label(text="Render Jobs", icon='RENDER_RESULT')
         header_row.operator("integrated.refresh_ui", icon='FILE_REFRESH', text="")
 
-        completed_count = sum(1 for job in settings.jobs if job.is_complete)
-        pending_count = len(settings.jobs) - completed_count
-        new_count = sum(1 for job in settings.jobs if job.has_notification)
+        completed_count = settings.completed_count
+        pending_count = settings.pending_count
+        new_count = settings.new_count
 
         if new_count > 0:
             badge_row = jobs_box.row()
             badge_row.alert = True
             badge_row.label(text=f"🔴 {new_count} new")
 
-        if len(settings.jobs) > 0:
+        if pending_count + completed_count == 0:
+            jobs_box.label(text="No render jobs yet", icon='INFO')
+        else:
             summary_row = jobs_box.row()
             summary_row.label(text=f"Pending: {pending_count} | Completed: {completed_count}")
 
-        if len(settings.jobs) == 0:
-            jobs_box.label(text="No render jobs yet", icon='INFO')
-        else:
             for i, job in enumerate(settings.jobs):
                 self.draw_job_item(jobs_box, job, i)
 
@@ -545,6 +1280,15 @@ class INTEGRATED_PT_remote_render(Panel):
             progress_row = job_box.row()
             progress_row.prop(job, "progress", text="Progress", slider=True)
 
+        if 0 < job.download_progress < 100:
+            download_row = job_box.row()
+            download_row.prop(job, "download_progress", text="Downloading", slider=True)
+
+        if job.download_message:
+            download_status_row = job_box.row()
+            download_status_row.alert = job.download_failed
+            download_status_row.label(text=job.download_message, icon='ERROR' if job.download_failed else 'FILE_FOLDER')
+
         if job.error_message:
             error_row = job_box.row()
             error_row.alert = True
@@ -572,12 +1316,41 @@ classes = [
 ]
 
 def register():
+    global _STOP
+    _STOP = threading.Event()
+
     for cls in classes:
         bpy.utils.register_class(cls)
 
     bpy.types.Scene.server_integrated_settings = bpy.props.PointerProperty(type=ServerIntegratedSettings)
 
+    for handlers, handler in app_handlers():
+        handlers.append(handler)
+    bpy.app.timers.register(flush_ui, persistent=True)
+    # Scene data isn't accessible while registering, index the open file right after
+    bpy.app.timers.register(lambda: on_load_post(None), first_interval=0.1)
+
 def unregister():
+    global _SESSION, _STREAM_SESSION, _EXEC
+    _STOP.set()
+    on_load_pre(None)
+
+    # Closed before the pool so idle connections can't be picked up by queued transfers,
+    # the pool's workers aren't daemons and are joined when Python exits
+    _SESSION.close()
+    _STREAM_SESSION.close()
+    _EXEC.shutdown(wait=False, cancel_futures=True)
+
+    _EXEC = new_executor()
+    _SESSION = new_session()
+    _STREAM_SESSION = new_session(retries=0)
+
+    for handlers, handler in app_handlers():
+        if handler in handlers:
+            handlers.remove(handler)
+    if bpy.app.timers.is_registered(flush_ui):
+        bpy.app.timers.unregister(flush_ui)
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 